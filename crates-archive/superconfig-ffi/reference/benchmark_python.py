@@ -4,12 +4,13 @@ Performance Benchmark: Python FFI vs NAPI vs WASI
 Tests startup time and operation speed differences across all SuperConfig FFI variants
 """
 
-import time
+import asyncio
+import timeit
 import statistics
 import subprocess
 import sys
 import json
-from pathlib import Path
+from array import array
 
 try:
     import superconfig_ffi
@@ -19,72 +20,126 @@ except ImportError:
     PYTHON_AVAILABLE = False
     print("❌ Python bindings not available - make sure superconfig_ffi.so exists")
 
+try:
+    import numpy as np
+except ImportError:
+    np = None
+
+try:
+    import orjson
+
+    _json_loads = orjson.loads
+except ImportError:
+    _json_loads = json.loads
+
+
+def _quantile(sorted_values, q):
+    """Linearly interpolated quantile of pre-sorted values (NumPy 'linear' method)"""
+    pos = (len(sorted_values) - 1) * q
+    lo = int(pos)
+    hi = min(lo + 1, len(sorted_values) - 1)
+    return sorted_values[lo] + (sorted_values[hi] - sorted_values[lo]) * (pos - lo)
+
 
 class PythonBenchmark:
     def __init__(self):
-        self.results = {"startup": [], "operations": []}
-
-    def measure_time_ns(self, func):
-        """Measure time in nanoseconds for high precision"""
-        start = time.perf_counter_ns()
-        result = func()
-        end = time.perf_counter_ns()
-        return {
-            "result": result,
-            "time_ns": end - start,
-            "time_ms": (end - start) / 1_000_000,
-        }
+        # Packed int64 nanosecond samples: 8 bytes per element instead of
+        # a 28-byte Python int object, and contiguous for the stats pass
+        self.results = {"startup": array("q"), "operations": array("q")}
 
     def benchmark_python_startup(self, iterations=50):
-        """Benchmark Python module import + instance creation"""
+        """Benchmark cold startup: fresh interpreter + import + instance"""
         print("  📊 Testing Python startup time...")
 
-        for i in range(iterations):
+        # Measure out of process: in-process reimport mostly times the
+        # dylib reopen, not what a real caller pays. A child interpreter
+        # reports import + instance creation in nanoseconds on stdout,
+        # matching the cold-start pattern used for the NAPI path.
+        snippet = (
+            "import time; t = time.perf_counter_ns(); "
+            "import superconfig_ffi; "
+            "superconfig_ffi.SuperConfig(); "
+            "print(time.perf_counter_ns() - t)"
+        )
 
-            def startup_test():
-                # Simulate fresh import by removing from cache
-                if "superconfig_ffi" in sys.modules:
-                    del sys.modules["superconfig_ffi"]
-                import superconfig_ffi
+        # Preallocate the sample buffer and index-assign to avoid
+        # growth reallocations and per-iteration append lookups
+        buf = self.results["startup"] = array("q", [0]) * iterations
 
-                return superconfig_ffi.SuperConfig()
+        args = [sys.executable, "-S", "-c", snippet]
 
-            measurement = self.measure_time_ns(startup_test)
-            self.results["startup"].append(measurement["time_ns"])
+        for i in range(iterations):
+            result = subprocess.run(args, capture_output=True, text=True)
+            if result.returncode != 0 and "-S" in args:
+                # -S hides a site-packages install of superconfig_ffi from
+                # the child; degrade to a stock interpreter (slightly more
+                # interpreter startup in the sample) rather than no data
+                args = [sys.executable, "-c", snippet]
+                result = subprocess.run(args, capture_output=True, text=True)
+            if result.returncode != 0:
+                print(f"  ❌ Python startup benchmark failed: {result.stderr}")
+                self.results["startup"] = array("q")
+                return
+            buf[i] = int(result.stdout)
 
     def benchmark_python_operations(self, iterations=1000):
         """Benchmark Python operations (instance creation + method calls)"""
         print("  ⚡ Testing Python operation speed...")
 
-        for i in range(iterations):
-
-            def operation_test():
-                config = superconfig_ffi.SuperConfig()
-                config.get_verbosity()
-                debug_config = config.with_debug_verbosity()
-                debug_verbosity = debug_config.get_verbosity()
-                return debug_verbosity
+        # timeit compiles the statement into a tight C-driven loop, so the
+        # sub-µs operation is amortized over `number` calls per sample
+        # instead of paying interpreter dispatch + timer overhead each time
+        repeat = 50
+        number = max(1, iterations // repeat)
+        timer = timeit.Timer(
+            "config = SuperConfig()\n"
+            "config.verbosity\n"
+            "debug_config = config.with_verbosity(2)\n"
+            "debug_config.verbosity",
+            globals={"SuperConfig": superconfig_ffi.SuperConfig},
+        )
+        samples = timer.repeat(repeat=repeat, number=number)
 
-            measurement = self.measure_time_ns(operation_test)
-            self.results["operations"].append(measurement["time_ns"])
+        # Store per-operation nanoseconds for each batch
+        self.results["operations"] = array(
+            "q", (round(s / number * 1_000_000_000) for s in samples)
+        )
 
     def calculate_stats(self, times):
         """Calculate comprehensive statistics"""
         if not times:
             return None
 
-        times_ms = [t / 1_000_000 for t in times]  # Convert to milliseconds
-        times_ms.sort()
-        n = len(times_ms)
+        n = len(times)
+
+        if np is not None:
+            # Vectorized path: one C-level pass instead of Python loops.
+            # array('q') buffers get a zero-copy int64 view.
+            if isinstance(times, array):
+                times_ms = np.frombuffer(times, dtype=np.int64) / 1_000_000
+            else:
+                times_ms = np.asarray(times, dtype=np.float64) / 1_000_000
+            return {
+                "count": n,
+                "min": float(times_ms.min()),
+                "max": float(times_ms.max()),
+                "avg": float(times_ms.mean()),
+                "median": float(np.median(times_ms)),
+                "p95": float(np.percentile(times_ms, 95)),
+                "p99": float(np.percentile(times_ms, 99)),
+                "stddev": float(times_ms.std(ddof=1)) if n > 1 else 0,
+            }
+
+        times_ms = sorted(t / 1_000_000 for t in times)  # Convert to milliseconds
 
         return {
             "count": n,
-            "min": min(times_ms),
-            "max": max(times_ms),
-            "avg": statistics.mean(times_ms),
-            "median": statistics.median(times_ms),
-            "p95": times_ms[int(n * 0.95)] if n > 0 else 0,
-            "p99": times_ms[int(n * 0.99)] if n > 0 else 0,
+            "min": times_ms[0],
+            "max": times_ms[-1],
+            "avg": statistics.fmean(times_ms),
+            "median": statistics.median_low(times_ms),
+            "p95": _quantile(times_ms, 0.95),
+            "p99": _quantile(times_ms, 0.99),
             "stddev": statistics.stdev(times_ms) if n > 1 else 0,
         }
 
@@ -98,7 +153,7 @@ class PythonBenchmark:
         # Warmup
         for _ in range(5):
             config = superconfig_ffi.SuperConfig()
-            config.get_verbosity()
+            config.verbosity
 
         self.benchmark_python_startup()
         self.benchmark_python_operations()
@@ -106,6 +161,12 @@ class PythonBenchmark:
         startup_stats = self.calculate_stats(self.results["startup"])
         operations_stats = self.calculate_stats(self.results["operations"])
 
+        if startup_stats is None or operations_stats is None:
+            # A failed sub-benchmark already printed its error; don't hand
+            # partial results to the comparison section
+            print("  ❌ Python benchmark incomplete")
+            return None
+
         print("  ✅ Python benchmark completed")
 
         return {
@@ -115,16 +176,9 @@ class PythonBenchmark:
         }
 
 
-def run_nodejs_benchmark():
-    """Run the Node.js benchmark and return results"""
-    print("🟢 Running Node.js benchmark...")
-
-    try:
-        # Create a simplified Node.js benchmark script
-        nodejs_script = """
-const { createRequire } = require('module');
+# Simplified Node.js benchmark script, built once at module load
+NODEJS_SCRIPT = """
 const { hrtime } = require('process');
-const require = createRequire(__filename);
 
 function measureTime(fn) {
     const start = hrtime.bigint();
@@ -187,35 +241,52 @@ async function benchmark() {
 }
 
 benchmark();
-        """
-
-        # Write and run the Node.js benchmark
-        with open("temp_nodejs_benchmark.js", "w") as f:
-            f.write(nodejs_script)
+"""
 
-        result = subprocess.run(
-            ["node", "temp_nodejs_benchmark.js"],
-            capture_output=True,
-            text=True,
-            timeout=60,
-        )
 
-        # Clean up
-        Path("temp_nodejs_benchmark.js").unlink(missing_ok=True)
+async def start_nodejs_benchmark():
+    """Launch the Node.js benchmark subprocess without waiting for it"""
+    print("🟢 Running Node.js benchmark...")
 
-        if result.returncode == 0:
-            data = json.loads(result.stdout)
-            print("  ✅ Node.js benchmark completed")
-            return data.get("napi", {})
-        else:
-            print(f"  ❌ Node.js benchmark failed: {result.stderr}")
-            return None
+    try:
+        # Pass the script straight to node - no temp file to write,
+        # unlink, or race on when run concurrently
+        return await asyncio.create_subprocess_exec(
+            "node",
+            "-e",
+            NODEJS_SCRIPT,
+            stdout=asyncio.subprocess.PIPE,
+            stderr=asyncio.subprocess.PIPE,
+        )
 
     except Exception as e:
         print(f"  ❌ Node.js benchmark error: {e}")
         return None
 
 
+async def collect_nodejs_results(process):
+    """Wait for the Node.js benchmark subprocess and parse its results"""
+    if process is None:
+        return None
+
+    try:
+        stdout, stderr = await asyncio.wait_for(process.communicate(), timeout=60)
+    except asyncio.TimeoutError:
+        process.kill()
+        print("  ❌ Node.js benchmark timed out")
+        return None
+
+    if process.returncode == 0:
+        # stdout is raw bytes off the pipe; orjson parses it without an
+        # intermediate str decode
+        data = _json_loads(stdout)
+        print("  ✅ Node.js benchmark completed")
+        return data.get("napi", {})
+    else:
+        print(f"  ❌ Node.js benchmark failed: {stderr.decode()}")
+        return None
+
+
 def print_comprehensive_results(python_results, nodejs_results):
     """Print detailed comparison of all three approaches"""
     print("\n📈 COMPREHENSIVE PERFORMANCE COMPARISON")
@@ -233,84 +304,51 @@ def print_comprehensive_results(python_results, nodejs_results):
     print("WASI (.wasm):     50KB")
 
     if python_results and nodejs_results:
-        # Startup comparison
+        def print_table(title, rows, precision):
+            """Print metric rows, flagging the fastest implementation per row"""
+            print(title)
+            print("─" * 60)
+            print(f"{'':17}{'Python':<12}{'NAPI':<12}{'WASI':<10}Fastest")
+            for name, py, napi, wasi in rows:
+                fastest = min(
+                    (("Python", py), ("NAPI", napi), ("WASI", wasi)),
+                    key=lambda kv: kv[1],
+                )[0]
+                print(
+                    f"{name + ':':17}"
+                    f"{py:<12.{precision}f}{napi:<12.{precision}f}"
+                    f"{wasi:<10.3f}{fastest}"
+                )
+
+        # Startup comparison (WASI figures from previous benchmark)
         py_startup = python_results["startup"]
         napi_startup = nodejs_results["startup"]
-        wasi_startup_avg = 1.203  # From previous benchmark
-
-        print("\n🚀 STARTUP PERFORMANCE (ms)")
-        print("─" * 60)
-        print("                Python    NAPI      WASI      Fastest")
-        print(
-            f"Average:        {py_startup['avg']:.3f}     {napi_startup['avg']:.3f}     {wasi_startup_avg:.3f}     ",
-            end="",
+        wasi_startup_avg = 1.203
+
+        print_table(
+            "\n🚀 STARTUP PERFORMANCE (ms)",
+            [
+                ("Average", py_startup["avg"], napi_startup["avg"], wasi_startup_avg),
+                ("Median", py_startup["median"], napi_startup["median"], 1.059),
+                ("95th percentile", py_startup["p95"], napi_startup["p95"], 1.996),
+            ],
+            precision=3,
         )
 
-        fastest_startup = min(py_startup["avg"], napi_startup["avg"], wasi_startup_avg)
-        if fastest_startup == py_startup["avg"]:
-            print("Python")
-        elif fastest_startup == napi_startup["avg"]:
-            print("NAPI")
-        else:
-            print("WASI")
-
-        print(
-            f"Median:         {py_startup['median']:.3f}     {napi_startup['median']:.3f}     1.059     ",
-            end="",
-        )
-        fastest_median = min(py_startup["median"], napi_startup["median"], 1.059)
-        if fastest_median == py_startup["median"]:
-            print("Python")
-        elif fastest_median == napi_startup["median"]:
-            print("NAPI")
-        else:
-            print("WASI")
-
-        print(
-            f"95th percentile: {py_startup['p95']:.3f}     {napi_startup['p95']:.3f}     1.996     ",
-            end="",
-        )
-        fastest_p95 = min(py_startup["p95"], napi_startup["p95"], 1.996)
-        if fastest_p95 == py_startup["p95"]:
-            print("Python")
-        elif fastest_p95 == napi_startup["p95"]:
-            print("NAPI")
-        else:
-            print("WASI")
-
-        # Operations comparison
+        # Operations comparison (WASI figures from previous benchmark)
         py_ops = python_results["operations"]
         napi_ops = nodejs_results["operations"]
-        wasi_ops_avg = 0.396  # From previous benchmark
-
-        print("\n⚡ OPERATION PERFORMANCE (ms)")
-        print("─" * 60)
-        print("                Python      NAPI        WASI      Fastest")
-        print(
-            f"Average:        {py_ops['avg']:.6f}   {napi_ops['avg']:.6f}   {wasi_ops_avg:.3f}     ",
-            end="",
+        wasi_ops_avg = 0.396
+
+        print_table(
+            "\n⚡ OPERATION PERFORMANCE (ms)",
+            [
+                ("Average", py_ops["avg"], napi_ops["avg"], wasi_ops_avg),
+                ("Median", py_ops["median"], napi_ops["median"], 0.230),
+            ],
+            precision=6,
         )
 
-        fastest_ops = min(py_ops["avg"], napi_ops["avg"], wasi_ops_avg)
-        if fastest_ops == py_ops["avg"]:
-            print("Python")
-        elif fastest_ops == napi_ops["avg"]:
-            print("NAPI")
-        else:
-            print("WASI")
-
-        print(
-            f"Median:         {py_ops['median']:.6f}   {napi_ops['median']:.6f}   0.230     ",
-            end="",
-        )
-        fastest_ops_median = min(py_ops["median"], napi_ops["median"], 0.230)
-        if fastest_ops_median == py_ops["median"]:
-            print("Python")
-        elif fastest_ops_median == napi_ops["median"]:
-            print("NAPI")
-        else:
-            print("WASI")
-
         # Performance ratios
         print("\n🏆 PERFORMANCE RATIOS (relative to fastest)")
         print("─" * 60)
@@ -353,17 +391,21 @@ def print_comprehensive_results(python_results, nodejs_results):
     print("🌐 Cross-platform deployment:               WASI")
 
 
-def main():
+async def main():
     """Run comprehensive benchmark across all FFI variants"""
     print("🎯 SuperConfig FFI Comprehensive Performance Benchmark")
     print("🔬 Testing Python, NAPI, and WASI versions\n")
 
+    # Launch the Node.js benchmark first so it runs in parallel with the
+    # in-process Python benchmark
+    node_process = await start_nodejs_benchmark()
+
     # Run Python benchmark
     python_benchmark = PythonBenchmark()
     python_results = python_benchmark.run_benchmark() if PYTHON_AVAILABLE else None
 
-    # Run Node.js benchmark
-    nodejs_results = run_nodejs_benchmark()
+    # Collect Node.js benchmark results
+    nodejs_results = await collect_nodejs_results(node_process)
 
     # Print comprehensive comparison
     print_comprehensive_results(python_results, nodejs_results)
@@ -377,4 +419,4 @@ def main():
 
 
 if __name__ == "__main__":
-    main()
+    asyncio.run(main())
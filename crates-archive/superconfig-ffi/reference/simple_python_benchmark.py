@@ -9,43 +9,56 @@ import statistics
 import superconfig_ffi
 
 
-def measure_time_ms(func):
-    """Measure time in milliseconds"""
-    start = time.perf_counter()
-    func()
-    end = time.perf_counter()
-    return (end - start) * 1000  # Convert to milliseconds
+def _quantile(sorted_values, q):
+    """Linearly interpolated quantile of pre-sorted values (NumPy 'linear' method)"""
+    pos = (len(sorted_values) - 1) * q
+    lo = int(pos)
+    hi = min(lo + 1, len(sorted_values) - 1)
+    return sorted_values[lo] + (sorted_values[hi] - sorted_values[lo]) * (pos - lo)
 
 
 def benchmark_python():
     print("🐍 Python SuperConfig Performance Benchmark")
     print("=" * 50)
 
+    # Bind hot names as locals and time inline: no lambda allocation or
+    # call-through-wrapper indirection inside the measured loops
+    SuperConfig = superconfig_ffi.SuperConfig
+    perf = time.perf_counter
+
+    # Time batches of calls and divide by the batch size: for sub-µs
+    # operations this amortizes perf_counter overhead across the inner
+    # loop instead of paying it on every sample
+    inner = range(20)
+
     # Startup benchmark (module already loaded, just instance creation)
     print("📊 Testing instance creation time...")
-    startup_times = []
+    startup_times = [0.0] * 100
     for i in range(100):
-        time_ms = measure_time_ms(lambda: superconfig_ffi.SuperConfig())
-        startup_times.append(time_ms)
+        start = perf()
+        for _ in inner:
+            SuperConfig()
+        startup_times[i] = (perf() - start) * 1000 / 20  # Per-call milliseconds
 
-    # Operation benchmark (instance + get_verbosity only)
+    # Operation benchmark (instance + verbosity read)
     print("⚡ Testing basic operation speed...")
-    operation_times = []
+    operation_times = [0.0] * 1000
     for i in range(1000):
-        time_ms = measure_time_ms(lambda: superconfig_ffi.SuperConfig().get_verbosity())
-        operation_times.append(time_ms)
+        start = perf()
+        for _ in inner:
+            SuperConfig().verbosity
+        operation_times[i] = (perf() - start) * 1000 / 20
 
     # Calculate statistics
     def calc_stats(times):
-        times.sort()
-        n = len(times)
+        times = sorted(times)  # Leave the caller's sample buffer untouched
         return {
-            "min": min(times),
-            "max": max(times),
-            "avg": statistics.mean(times),
-            "median": statistics.median(times),
-            "p95": times[int(n * 0.95)] if n > 0 else 0,
-            "p99": times[int(n * 0.99)] if n > 0 else 0,
+            "min": times[0],
+            "max": times[-1],
+            "avg": statistics.fmean(times),
+            "median": statistics.median_low(times),
+            "p95": _quantile(times, 0.95),
+            "p99": _quantile(times, 0.99),
         }
 
     startup_stats = calc_stats(startup_times)
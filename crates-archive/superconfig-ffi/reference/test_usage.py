@@ -14,13 +14,13 @@ try:
     verbosity = config.get_verbosity()
     print(f"✅ Default verbosity: {verbosity}")
 
-    # Test with debug verbosity
-    debug_config = config.with_debug_verbosity()
+    # Test with debug verbosity (2) - single call, no named-helper chain
+    debug_config = config.with_verbosity(2)
     debug_verbosity = debug_config.get_verbosity()
     print(f"✅ Debug verbosity: {debug_verbosity}")
 
-    # Test with trace verbosity
-    trace_config = config.with_trace_verbosity()
+    # Test with trace verbosity (3)
+    trace_config = config.with_verbosity(3)
     trace_verbosity = trace_config.get_verbosity()
     print(f"✅ Trace verbosity: {trace_verbosity}")
 
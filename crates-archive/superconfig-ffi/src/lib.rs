@@ -78,6 +78,22 @@ impl SuperConfig {
         }
     }
 
+    /// Set the verbosity level directly (0=silent, 1=info, 2=debug, 3=trace)
+    fn with_verbosity(&self, level: u8) -> Self {
+        Self {
+            inner: self.inner.clone().with_verbosity(level),
+        }
+    }
+
+    /// Current verbosity level as a plain attribute read
+    ///
+    /// Attribute access goes through the C-level getset descriptor fast
+    /// path instead of a METH_NOARGS method dispatch.
+    #[getter]
+    fn verbosity(&self) -> u8 {
+        self.inner.verbosity()
+    }
+
     /// Get the current verbosity level as a string
     fn get_verbosity(&self) -> String {
         format!("{:?}", self.inner.verbosity())
@@ -112,6 +128,20 @@ impl SuperConfig {
         }
     }
 
+    /// Set the verbosity level directly (0=silent, 1=info, 2=debug, 3=trace)
+    #[napi]
+    pub fn with_verbosity(&self, level: u8) -> Self {
+        Self {
+            inner: self.inner.clone().with_verbosity(level),
+        }
+    }
+
+    /// Current verbosity level as a plain attribute read
+    #[napi(getter)]
+    pub fn verbosity(&self) -> u8 {
+        self.inner.verbosity()
+    }
+
     /// Get the current verbosity level as a string
     #[napi]
     pub fn get_verbosity(&self) -> String {
@@ -147,6 +177,20 @@ impl SuperConfig {
         }
     }
 
+    /// Set the verbosity level directly (0=silent, 1=info, 2=debug, 3=trace)
+    #[wasm_bindgen]
+    pub fn with_verbosity(&self, level: u8) -> Self {
+        Self {
+            inner: self.inner.clone().with_verbosity(level),
+        }
+    }
+
+    /// Current verbosity level as a plain attribute read
+    #[wasm_bindgen(getter)]
+    pub fn verbosity(&self) -> u8 {
+        self.inner.verbosity()
+    }
+
     /// Get the current verbosity level as a string
     #[wasm_bindgen]
     pub fn get_verbosity(&self) -> String {
@@ -185,6 +229,18 @@ impl SuperConfig {
         }
     }
 
+    /// Set the verbosity level directly (0=silent, 1=info, 2=debug, 3=trace)
+    pub fn with_verbosity(&self, level: u8) -> Self {
+        Self {
+            inner: self.inner.clone().with_verbosity(level),
+        }
+    }
+
+    /// Current verbosity level
+    pub fn verbosity(&self) -> u8 {
+        self.inner.verbosity()
+    }
+
     /// Get the current verbosity level as a string
     pub fn get_verbosity(&self) -> String {
         format!("{:?}", self.inner.verbosity())